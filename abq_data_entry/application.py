@@ -25,8 +25,14 @@ class Application(tk.Tk):
               text="ABQ Data Entry Application",      # Start with Label constructor for the main window
               font=("TKDefaultFont", 16)).grid(row=0) # Column not necessary because this is overall window layout
 
-    self.recordform = v.DataRecordForm(self, m.CSVModel.fields)    # Create recordform that calls DataRecordForm class; pass self
-    self.recordform.grid(row=1, padx=10)      # Set the recordform in row 1
+    # Single record and batch forms share row 1 as notebook tabs; Ctrl-Tab switches between them
+    self.notebook = ttk.Notebook(self)
+    self.notebook.enable_traversal()
+    self.recordform = v.DataRecordForm(self.notebook, m.CSVModel.fields)    # Create recordform that calls DataRecordForm class
+    self.notebook.add(self.recordform, text="Single Record", underline=0)
+    self.batchform = v.BatchRecordForm(self.notebook, m.CSVModel.fields)    # One row per plot for a whole lab
+    self.notebook.add(self.batchform, text="Batch Entry", underline=0)
+    self.notebook.grid(row=1, padx=10)        # Set the notebook in row 1
 
     # Create the save button for the form
     self.savebutton = ttk.Button(self, text="Save",   # Construct save button; perform on_save function on click
@@ -44,8 +50,12 @@ class Application(tk.Tk):
   def on_save(self):
     """Perform function when user clicks Save button."""
     
+    # Save from whichever form's tab is showing
+    batch = self.notebook.select() == str(self.batchform)
+    form = self.batchform if batch else self.recordform
+
     # Check for errors in form; if there are, do not allow user to save
-    errors = self.recordform.get_errors()
+    errors = form.get_errors()
     if errors:
       self.status.set(
               "Cannot save, error in fields:\n{}".format(', '.join(errors.keys())))
@@ -61,17 +71,21 @@ class Application(tk.Tk):
     filename = "abq_data_record_{}.csv".format(datestring)# Append the datestring to filename variable
     model = m.CSVModel(filename)     # Identify the model in model module and pass in filename
     
-    # Get data from the DataEntryForm
-    data = self.recordform.get()                          # Set values identified from record form in data variable
+    # Get data from the form; the batch form gives a list of records
+    data = form.get()                                     # Set values identified from the form in data variable
 
-    # Save the record via the model module
-    model.save_record(data)
+    # Save the record(s) via the model module
+    if batch:
+      model.save_records(data)                            # Whole batch in one write
+      self.records_saved += len(data)
+    else:
+      model.save_record(data)
+      self.records_saved += 1
 
     # Increment record saved message
-    self.records_saved += 1
     self.status.set(
       "{} records saved this session".format(self.records_saved))
-    self.recordform.reset()
+    form.reset()
 
 
 
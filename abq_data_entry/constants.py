@@ -7,4 +7,3 @@ class FieldTypes:
   integer = 6
   boolean = 7
 
-print("\nThis is a test.\n")
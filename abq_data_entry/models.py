@@ -1,5 +1,12 @@
+import asyncio
 import csv
+import io
+import json
+import locale
+import logging
 import os
+import time
+from datetime import datetime, timedelta
 from .constants import FieldTypes as FT
 
 class CSVModel:
@@ -29,11 +36,144 @@ class CSVModel:
     """Allows passage of a filename."""
     self.filename = filename    # Takes filename parameter and stores it as a property
 
+  @classmethod
+  def parse_record(cls, row):
+    """Convert a dict of CSV strings into Python values using the field types."""
+    record = {}
+    for key, spec in cls.fields.items():
+      value = row.get(key, '')
+      field_type = spec['type']
+      if field_type in (FT.string, FT.string_list, FT.long_string):
+        record[key] = value
+      elif value == '':                         # Empty numeric, date or boolean field
+        record[key] = None
+      elif field_type == FT.iso_date_string:
+        record[key] = datetime.strptime(value, '%Y-%m-%d').date()
+      elif field_type == FT.decimal:
+        record[key] = float(value)
+      elif field_type == FT.integer:
+        record[key] = int(value)
+      elif field_type == FT.boolean:
+        record[key] = value == 'True'           # Written from a BooleanVar
+      else:
+        record[key] = value
+    return record
+
   def save_record(self, data):
     """Save a dict of data to the CSV file."""
+    self.save_records([data])
+
+  def save_records(self, rows):
+    """Save a list of data dicts to the CSV file in one write."""
     newfile = not os.path.exists(self.filename)
     with open(self.filename, 'a') as fh:
       csvwriter = csv.DictWriter(fh, fieldnames=self.fields.keys())
       if newfile:
         csvwriter.writeheader()
-      csvwriter.writerow(data)
+      csvwriter.writerows(rows)
+
+
+class CSVFollower:
+  """Follow the daily CSV files, reading only the records appended since the last read."""
+
+  filename_format = 'abq_data_record_{}.csv'    # Same name Application.on_save writes to
+
+  def __init__(self, directory='.', checkpoint=None, start_date=None):
+    """Resume from the checkpoint file if it exists, else start at the top of start_date's file (today)."""
+    self.directory = directory
+    self.checkpoint = checkpoint                # Optional JSON file holding the date and byte offset
+    self.date = start_date or datetime.today().date()
+    self.offset = 0                             # Bytes of the current file already read
+    if checkpoint and os.path.exists(checkpoint):
+      with open(checkpoint) as fh:
+        state = json.load(fh)
+      self.date = datetime.strptime(state['date'], '%Y-%m-%d').date()
+      self.offset = state['offset']
+
+  @property
+  def filename(self):
+    """Path of the file for the date being followed."""
+    datestring = self.date.strftime('%Y-%m-%d')
+    return os.path.join(self.directory, self.filename_format.format(datestring))
+
+  def save_checkpoint(self):
+    """Write the current date and offset to the checkpoint file, if there is one."""
+    if not self.checkpoint:
+      return
+    temp = self.checkpoint + '.tmp'             # Write then rename, so a crash never leaves half a file
+    with open(temp, 'w') as fh:
+      json.dump({'date': self.date.strftime('%Y-%m-%d'), 'offset': self.offset}, fh)
+    os.replace(temp, self.checkpoint)
+
+  def poll(self):
+    """Return the records appended since the last poll, rolling over to later days' files."""
+    # Check the date before reading, so a row added to the old file just before midnight is
+    # read on this poll or the next one; a last read catches a save still landing as we leave
+    today = datetime.today().date()
+    records = self._read()
+    while self.date < today:                    # The application has moved on to a later file
+      records.extend(self._read())
+      self.date += timedelta(days=1)
+      self.offset = 0
+      records.extend(self._read())
+    return records
+
+  def follow(self, interval=2.0):
+    """Yield records as they are appended, checking every interval seconds."""
+    while True:
+      position = (self.date, self.offset)
+      for record in self.poll():
+        yield record
+      if (self.date, self.offset) != position:  # Only after the records were consumed
+        self.save_checkpoint()
+      time.sleep(interval)
+
+  async def stream(self, interval=2.0):
+    """Asynchronous version of follow(); file reads run in the default executor."""
+    loop = asyncio.get_running_loop()
+    while True:
+      position = (self.date, self.offset)
+      for record in await loop.run_in_executor(None, self.poll):
+        yield record
+      if (self.date, self.offset) != position:
+        self.save_checkpoint()
+      await asyncio.sleep(interval)
+
+  def _read(self):
+    """Read the complete rows past the offset in the current file and advance the offset."""
+    try:
+      with open(self.filename, 'rb') as fh:
+        if os.fstat(fh.fileno()).st_size < self.offset:   # File was replaced; start it over
+          self.offset = 0
+        fh.seek(self.offset)
+        data = fh.read()
+    except FileNotFoundError:                   # Nothing saved for this date (yet)
+      return []
+
+    # A row is complete at a newline with an even number of quotes before it;
+    # Notes can hold newlines inside quotes, and the last row may be half written
+    end = 0
+    quotes = 0
+    start = 0
+    newline = data.find(b'\n')
+    while newline != -1:
+      quotes += data.count(b'"', start, newline)
+      start = newline + 1
+      if quotes % 2 == 0:
+        end = start
+      newline = data.find(b'\n', start)
+
+    # Decode the same way CSVModel.save_record's open() encoded it
+    text = data[:end].decode(locale.getpreferredencoding(False))
+    header = list(CSVModel.fields.keys())
+    records = []
+    for row in csv.reader(io.StringIO(text, newline='')):
+      if not row or row == header:              # Skip blank lines and each file's header
+        continue
+      try:
+        records.append(CSVModel.parse_record(dict(zip(header, row))))
+      except ValueError as e:                   # E.g. edited by hand in a spreadsheet; skip it
+        logging.getLogger(__name__).warning(
+          'Skipping bad row in %s: %s (%s)', self.filename, row, e)
+    self.offset += end                          # Only once the whole batch is parsed
+    return records
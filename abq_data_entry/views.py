@@ -2,6 +2,19 @@ import tkinter as tk
 from tkinter import ttk
 from datetime import datetime
 from . import widgets as w
+from .constants import FieldTypes as FT
+
+# Tcl procs that read or write every form field at once; defined once per interpreter so Tcl
+# compiles them once. Values are passed as arguments, never pasted into the script, so nothing needs quoting.
+BULK_GET = ('abq_bulk_get', 'vars texts', """
+  set values [lmap v $vars {set ::$v}]
+  foreach t $texts {lappend values [$t get 1.0 end]}
+  return $values
+""")
+BULK_SET = ('abq_bulk_set', 'vars values texts textvalues', """
+  foreach v $vars x $values {set ::$v $x}
+  foreach t $texts x $textvalues {$t delete 1.0 end; $t insert 1.0 $x}
+""")
 
 class DataRecordForm(tk.Frame):         # Build class as subclass of tkinter Frame class
   """The input form for our widgets."""
@@ -117,42 +130,61 @@ class DataRecordForm(tk.Frame):         # Build class as subclass of tkinter Fra
     plantinfo.grid(row=2, column=0, sticky=(tk.W + tk.E)) # Place widgets in form's third row
     # notesinfo.grid(row=3, column=0, sticky=(tk.W + tk.E)) # Place widget in form's fourth and final row # NO NEED
 
+    # Sort inputs into Tcl variables and Text widgets so get/set/reset need one Tcl call each
+    self._var_keys = [key for key, widget in self.inputs.items() if widget.variable]
+    self._text_keys = [key for key, widget in self.inputs.items() if not widget.variable]
+    self._var_names = tuple(str(self.inputs[key].variable) for key in self._var_keys)
+    self._text_paths = tuple(str(self.inputs[key].input) for key in self._text_keys)
+    self._plot_values = self.inputs['Plot'].input.cget('values')  # Fixed by the field spec; read once
+    for proc in (BULK_GET, BULK_SET):
+      self.tk.call('proc', *proc)
+
     # Default the form to have blank values
     self.reset()
 
   def get(self):                              # Method lives in form's class
     """Retrieve data from form."""
-    data = {}                                 # Create empty library to collect all widget information
-    for key, widget in self.inputs.items():   # For every key and value identified in self.inputs.items()...
-      data[key] = widget.get()                # Populate data dictionary with key and requisite values(s)
-    return data                               # When complete, return the library
+    raw = self.tk.splitlist(self.tk.call(       # Read every field in a single Tcl call
+      BULK_GET[0], self._var_names, self._text_paths))
+    keys = self._var_keys + self._text_keys   # Values come back vars first, then texts
+    converted = {key: self.inputs[key].convert(value) for key, value in zip(keys, raw)}
+    return {key: converted[key] for key in self.inputs}   # Keep the form's field order
+
+  def set(self, data):                        # Method lives in form's class
+    """Set every field in the form from a dictionary of values."""
+    values = []                               # Values for Tcl variables, in self._var_keys order
+    for key in self._var_keys:
+      value = data.get(key, '')
+      if isinstance(self.inputs[key].variable, tk.BooleanVar):
+        value = bool(value)                   # Same coercion as LabelInput.set
+      values.append(value)
+    textvalues = tuple(data.get(key, '') for key in self._text_keys)
+    self.tk.call(BULK_SET[0],                 # Write every field in a single Tcl call
+                 self._var_names, tuple(values), self._text_paths, textvalues)
 
   def reset(self):                            # Method lives in form's class
     """Reset the form once all information has been saved."""
 
     # Gather the values to keep for each lab
-    lab = self.inputs['Lab'].get()
-    time = self.inputs['Time'].get()
-    technician = self.inputs['Technician'].get()
-    plot = self.inputs['Plot'].get()
-    plot_values = self.inputs['Plot'].input.cget('values')
-
-    # Clear all values
-    for widget in self.inputs.values():       # For every widget (keys in the dictionary)...
-      widget.set('')                          # Set the value to blank/empty value
-
-    current_date = datetime.today().strftime('%Y-%m-%d')
-    self.inputs['Date'].set(current_date)
-    self.inputs['Time'].input.focus()
-  
+    current = self.get()
+    plot = current['Plot']
+    plot_values = self._plot_values
+
+    # Clear all values and set today's date
+    data = {'Date': datetime.today().strftime('%Y-%m-%d')}
+    focus = self.inputs['Time'].input
+
     # Check if we need to put our values back, then do it.
     if plot not in ('', plot_values[-1]):
-      self.inputs['Lab'].set(lab)
-      self.inputs['Time'].set(time)
-      self.inputs['Technician'].set(technician)
+      data['Lab'] = current['Lab']
+      data['Time'] = current['Time']
+      data['Technician'] = current['Technician']
       next_plot_index = plot_values.index(plot) + 1
-      self.inputs['Plot'].set(plot_values[next_plot_index])
-      self.inputs['Seed sample'].input.focus()
+      data['Plot'] = plot_values[next_plot_index]
+      focus = self.inputs['Seed sample'].input
+
+    self.set(data)                            # Every field not in data is cleared
+    focus.focus()
 
   def get_errors(self):
     """Get a list of field errors in the form."""
@@ -165,4 +197,291 @@ class DataRecordForm(tk.Frame):         # Build class as subclass of tkinter Fra
     return errors
 
 
+class BatchRecordForm(tk.Frame):        # Build class as subclass of tkinter Frame class
+  """Spreadsheet-style form for a whole lab: one row per Plot, shared Date/Time/Technician/Lab.
+
+  Cells are edited with one reusable validated widget per column, placed over the cell;
+  the Treeview only draws the rows that are scrolled into view.
+  """
+
+  shared_fields = ('Date', 'Time', 'Technician', 'Lab')   # Entered once for the whole batch
+  row_field = 'Plot'                                      # One grid row per value of this field
+  height_limits = {                                       # (min column, max column) within a row
+    'Minimum Height': (None, 'Maximum Height'),
+    'Maximum Height': ('Minimum Height', None),
+    'Median Height': ('Minimum Height', 'Maximum Height'),
+  }
+
+  def __init__(self, parent, fields, *args, **kwargs):
+    super().__init__(parent, *args, **kwargs)   # Inherit identified args and kwargs from the constructor
+    self.fields = fields
+    self.inputs = {}        # Shared inputs only; the grid's values live in self.values
+
+    # Build the batchinfo frame; one LabelInput per shared field
+    batchinfo = tk.LabelFrame(self, text="Batch Information")
+    for column, key in enumerate(self.shared_fields):
+      self.inputs[key] = w.LabelInput(batchinfo, key, field_spec=fields[key])
+      self.inputs[key].grid(row=0, column=column)
+
+    # Build the plotinfo frame; every field that is not shared gets a grid column
+    plotinfo = tk.LabelFrame(self, text="Plot Data")
+    self.plots = list(fields[self.row_field]['values'])
+    self.columns = [key for key in fields if key not in self.shared_fields]
+    self.edit_columns = [key for key in self.columns if key != self.row_field]
+
+    self.tree = ttk.Treeview(plotinfo, columns=self.columns, show='headings',
+                             height=10, selectmode='browse')
+    for key in self.columns:
+      self.tree.heading(key, text=key)
+      self.tree.column(key, width=(160 if key == 'Notes' else max(40, 7 * len(key))), stretch=False)
+    self.tree.tag_configure('error', foreground='red')
+    self.scrollbar = ttk.Scrollbar(plotinfo, orient=tk.VERTICAL, command=self.tree.yview)
+    self.tree.configure(yscrollcommand=self._on_yscroll)
+    self.tree.grid(row=0, column=0, sticky=(tk.W + tk.E))
+    self.scrollbar.grid(row=0, column=1, sticky=(tk.N + tk.S))
+
+    # Error for the cell being edited, shown like a LabelInput's error label
+    self.error = tk.StringVar()
+    ttk.Label(plotinfo, textvariable=self.error, foreground="maroon").grid(
+      row=1, column=0, columnspan=2, sticky=(tk.W + tk.E))
+
+    # Keyboard: Return/F2 edits the focused row; mouse: double-click edits a cell
+    self.tree.bind('<Return>', self._on_edit_key)
+    self.tree.bind('<F2>', self._on_edit_key)
+    self.tree.bind('<Double-1>', self._on_double_click)
+    self.tree.bind('<Button-1>', lambda event: self._commit())
+    self.tree.bind('<FocusIn>', self._on_focus_in)
+
+    batchinfo.grid(row=0, column=0, sticky=(tk.W + tk.E))
+    plotinfo.grid(row=1, column=0, sticky=(tk.W + tk.E))
+
+    self.editors = {}       # One editor widget per column, created the first time it is needed
+    self.editor_vars = {}   # The editors' variables, keyed the same way
+    self.cell = None        # (plot, column) of the open editor, if any
+    self.last_column = self.edit_columns[0]
+
+    # Default the form to have blank values; leave focus with whichever tab is showing
+    self.reset(focus=False)
+
+  def get(self):
+    """Retrieve one record per plot, with the shared fields filled in."""
+    self._commit()
+    shared = {key: widget.get() for key, widget in self.inputs.items()}
+    records = []
+    for plot in self.plots:
+      record = dict(shared)
+      record.update(self.values[plot])
+      records.append(record)
+    return records
+
+  def reset(self, focus=True):
+    """Clear the batch once it has been saved; focus moves to Time unless focus is False."""
+    self._close()
+    for widget in self.inputs.values():       # Clear the shared fields
+      widget.set('')
+    self.inputs['Date'].set(datetime.today().strftime('%Y-%m-%d'))
+
+    self.values = {}        # {plot: {column: value}}
+    self.errors = {}        # {(plot, column): error message}
+    self.tree.delete(*self.tree.get_children())
+    for plot in self.plots:
+      self.values[plot] = {key: self._blank(key) for key in self.columns}
+      self.values[plot][self.row_field] = plot
+      self.tree.insert('', tk.END, iid=plot)
+      self._refresh(plot)
+    self.error.set('')
+    if focus:
+      self.inputs['Time'].input.focus()
+
+  def get_errors(self):
+    """Get a dict of field errors; cell errors are grouped by plot."""
+    errors = {}
+    for key, widget in self.inputs.items():
+      if hasattr(widget.input, 'trigger_focusout_validation'):
+        widget.input.trigger_focusout_validation()
+      if widget.error.get():
+        errors[key] = widget.error.get()
+
+    self._commit()
+    for plot in self.plots:                   # Run every cell through its column's validated editor
+      for column in self.edit_columns:
+        self._load(plot, column)
+        self._check(plot, column)
+      self._refresh(plot)
+      row_errors = ['{}: {}'.format(column, self.errors[(plot, column)])
+                    for column in self.edit_columns if (plot, column) in self.errors]
+      if row_errors:
+        errors['{} {}'.format(self.row_field, plot)] = '; '.join(row_errors)
+    return errors
 
+  def _blank(self, key):
+    """Return the empty value for a column."""
+    return False if self.fields[key]['type'] == FT.boolean else ''
+
+  def _display(self, value):
+    """Return the text shown in a grid cell."""
+    if isinstance(value, bool):
+      return 'Yes' if value else 'No'
+    return str(value)
+
+  def _refresh(self, plot):
+    """Redraw a row's cells and its error tag."""
+    has_error = any((plot, column) in self.errors for column in self.edit_columns)
+    self.tree.item(plot, values=[self._display(self.values[plot][key]) for key in self.columns],
+                   tags=(('error',) if has_error else ()))
+
+  def _editor(self, column):
+    """Return the editor widget for a column, creating it the first time."""
+    if column not in self.editors:
+      field_spec = self.fields[column]
+      input_args = {}
+      if field_spec['type'] == FT.long_string:  # Notes get a one-line Entry in the grid
+        input_class, var_type = ttk.Entry, tk.StringVar
+      else:
+        input_class, var_type = w.LabelInput.spec_input(field_spec, input_args)
+      variable = var_type()
+      if input_class is ttk.Checkbutton:
+        input_args['variable'] = variable
+      else:
+        input_args['textvariable'] = variable
+      editor = input_class(self.tree, **input_args)
+
+      # Tab/Shift-Tab move across, Return/Up/Down move down and up, Escape cancels
+      for sequence, rows, columns in (('<Tab>', 0, 1), ('<Shift-Tab>', 0, -1),
+                                      ('<<PrevWindow>>', 0, -1), ('<Return>', 1, 0),
+                                      ('<Down>', 1, 0), ('<Up>', -1, 0)):
+        editor.bind(sequence, lambda event, rows=rows, columns=columns: self._move(rows, columns))
+      editor.bind('<Escape>', self._cancel)
+
+      self.editors[column] = editor
+      self.editor_vars[column] = variable
+    return self.editors[column]
+
+  def _load(self, plot, column):
+    """Put a cell's value into its column's editor, with that row's height limits."""
+    editor = self._editor(column)
+    if column in self.height_limits:
+      low, high = self.height_limits[column]
+      spec_from = self.fields[column].get('min', '-Infinity')
+      spec_to = self.fields[column].get('max', 'Infinity')
+      from_, to = spec_from, spec_to
+      if low and self.values[plot][low] != '':
+        from_ = self.values[plot][low]
+      if high and self.values[plot][high] != '':
+        to = self.values[plot][high]
+      try:
+        editor.config(from_=from_, to=to)
+      except (tk.TclError, ValueError):       # Row's min is above its max; the min/max cells show that error
+        editor.config(from_=spec_from, to=spec_to)
+    self.editor_vars[column].set(self.values[plot][column])
+    return editor
+
+  def _check(self, plot, column):
+    """Validate the value loaded in a column's editor and record any error for the cell."""
+    editor = self.editors[column]
+    self.errors.pop((plot, column), None)
+    if hasattr(editor, 'trigger_focusout_validation'):
+      editor.trigger_focusout_validation()
+      if editor.error.get():
+        self.errors[(plot, column)] = editor.error.get()
+
+  def _open(self, plot, column):
+    """Open the editor over a cell, scrolling its row into view."""
+    self.tree.see(plot)
+    self.tree.selection_set(plot)
+    self.tree.focus(plot)
+    self.tree.update_idletasks()              # Let the scroll happen so bbox is current
+    editor = self._load(plot, column)
+    self.cell = (plot, column)
+    self.last_column = column
+    self._place()
+    editor.focus()
+    if hasattr(editor, 'selection_range'):
+      editor.selection_range(0, tk.END)
+    self.error.set(self.errors.get(self.cell, ''))
+
+  def _place(self):
+    """Keep the open editor over its cell, or hide it while the cell is scrolled away."""
+    plot, column = self.cell
+    bbox = self.tree.bbox(plot, column)
+    if bbox:
+      x, y, width, height = bbox
+      self.editors[column].place(x=x, y=y, width=width, height=height)
+    else:
+      self.editors[column].place_forget()
+
+  def _close(self):
+    """Hide the open editor without storing its value."""
+    if self.cell:
+      editor = self.editors[self.cell[1]]
+      editor.place_forget()
+      if str(self.tk.call('focus')) == str(editor):  # Don't leave the keyboard on a hidden widget
+        self.tree.focus_set()
+      self.cell = None
+
+  def _commit(self):
+    """Store and validate the open editor's value, then hide it."""
+    if not self.cell:
+      return
+    plot, column = self.cell
+    try:
+      self.values[plot][column] = self.editor_vars[column].get()
+    except (TypeError, tk.TclError):          # Happens when numeric fields are empty
+      self.values[plot][column] = ''
+    self._check(plot, column)
+    self._refresh(plot)
+    self.error.set(self.errors.get(self.cell, ''))
+    self._close()
+
+  def _move(self, rows, columns):
+    """Commit the open cell and open the one rows down and columns across from it."""
+    if self.cell is None:                     # Editor was already closed, e.g. by Save
+      return 'break'
+    plot, column = self.cell
+    row = self.plots.index(plot) + rows
+    col = self.edit_columns.index(column) + columns
+    if col >= len(self.edit_columns):         # Tab off the end of a row wraps to the next one
+      row, col = row + 1, 0
+    elif col < 0:                             # Shift-Tab off the start wraps to the previous one
+      row, col = row - 1, len(self.edit_columns) - 1
+    self._commit()
+    if 0 <= row < len(self.plots):
+      self._open(self.plots[row], self.edit_columns[col])
+    else:                                     # Off the grid; hand focus back to the Treeview
+      self.tree.focus_set()
+    return 'break'
+
+  def _cancel(self, event):
+    """Discard the open editor's changes."""
+    self._close()
+    self.tree.focus_set()
+    return 'break'
+
+  def _on_edit_key(self, event):
+    """Edit the focused row, starting at the last column edited."""
+    plot = self.tree.focus() or self.plots[0]
+    self._open(plot, self.last_column)
+    return 'break'
+
+  def _on_double_click(self, event):
+    """Edit the cell under the mouse pointer."""
+    plot = self.tree.identify_row(event.y)
+    column = self.tree.identify_column(event.x)   # '#1' is the first column
+    if not plot or not column:
+      return
+    column = self.columns[int(column[1:]) - 1]
+    if column in self.edit_columns:
+      self._open(plot, column)
+    return 'break'
+
+  def _on_focus_in(self, event):
+    """Give the Treeview a focused row so the keyboard has somewhere to start."""
+    if not self.tree.focus():
+      self.tree.focus(self.plots[0])
+      self.tree.selection_set(self.plots[0])
+
+  def _on_yscroll(self, first, last):
+    """Update the scrollbar and follow the open cell."""
+    self.scrollbar.set(first, last)
+    if self.cell:
+      self._place()
@@ -292,20 +292,9 @@ class LabelInput(tk.Frame):             # Build class as subclass of tkinter Fra
     input_args = input_args or {}       # Ensure this is a dictionary
     label_args = label_args or {}       # Ensure this is a dictionary
     if field_spec:
-      field_type = field_spec.get('type', FT.string)
-      input_class = input_class or self.field_types.get(field_type)[0]
-      var_type = self.field_types.get(field_type)[1]
+      spec_class, var_type = self.spec_input(field_spec, input_args)
+      input_class = input_class or spec_class
       self.variable = input_var if input_var else var_type()
-      # Min, Max, Increment
-      if 'min' in field_spec and 'from_' not in input_args:
-        input_args['from_'] = field_spec.get('min')
-      if 'max' in field_spec and 'to' not in input_args:
-        input_args['to'] = field_spec.get('max')
-      if 'inc' in field_spec and 'increment' not in input_args:
-        input_args['increment'] = field_spec.get('inc')
-      # values
-      if 'values' in field_spec and 'values' not in input_args:
-        input_args['values'] = field_spec.get('values')
     else:
       self.variable = input_var           # Save reference to input variable as self.variable
 
@@ -325,6 +314,23 @@ class LabelInput(tk.Frame):             # Build class as subclass of tkinter Fra
     self.error_label = ttk.Label(self, textvariable=self.error, foreground="maroon")
     self.error_label.grid(row=2, column=0, sticky=(tk.W + tk.E))
 
+  @classmethod
+  def spec_input(cls, field_spec, input_args):  # Shared with other views that build inputs from specs
+    """Return the input class and variable type for a field spec; fill input_args from it."""
+    field_type = field_spec.get('type', FT.string)
+    input_class, var_type = cls.field_types.get(field_type)
+    # Min, Max, Increment
+    if 'min' in field_spec and 'from_' not in input_args:
+      input_args['from_'] = field_spec.get('min')
+    if 'max' in field_spec and 'to' not in input_args:
+      input_args['to'] = field_spec.get('max')
+    if 'inc' in field_spec and 'increment' not in input_args:
+      input_args['increment'] = field_spec.get('inc')
+    # values
+    if 'values' in field_spec and 'values' not in input_args:
+      input_args['values'] = field_spec.get('values')
+    return input_class, var_type
+
   def grid(self, sticky=(tk.E + tk.W), **kwargs):   # Set up layout to auto-place, as appropriate
     super().grid(sticky=sticky, **kwargs)           # Call from parent widget grid information and any kwargs
 
@@ -339,6 +345,23 @@ class LabelInput(tk.Frame):             # Build class as subclass of tkinter Fra
     except (TypeError, tk.TclError):          # Happens when numeric fields are empty
       return ''                               # Return blank string
 
+  def convert(self, value):                   # Convert a raw value read in bulk from Tcl
+    """Convert a raw Tcl value to the same Python value get() would return."""
+    try:                                      # Try this; throw exception if error
+      if isinstance(self.variable, tk.BooleanVar):  # Check BooleanVar first; it is not an IntVar
+        return self.tk.getboolean(value)
+      elif isinstance(self.variable, tk.IntVar):    # IntVar falls back to a float string, like IntVar.get
+        try:
+          return self.tk.getint(value)
+        except (TypeError, tk.TclError):
+          return int(self.tk.getdouble(value))
+      elif isinstance(self.variable, tk.DoubleVar):
+        return self.tk.getdouble(value)
+      else:                                   # Strings and Text contents
+        return str(value)
+    except (TypeError, tk.TclError):          # Happens when numeric fields are empty
+      return ''                               # Return blank string
+
   def set(self, value, *args, **kwargs):        # Pass request to variable or widget
     if type(self.variable) == tk.BooleanVar:    # If it's True or False...
       self.variable.set(bool(value))            # Set 'variable' to passed True or False value
@@ -0,0 +1,33 @@
+"""
+Print records as they are appended to the daily ABQ CSV files, one JSON object per line.
+With --checkpoint, a restart picks up where the last run stopped.
+"""
+
+import argparse
+import json
+import logging
+from abq_data_entry.models import CSVFollower
+
+logging.basicConfig(format="%(levelname)s: %(message)s")  # Skipped rows are reported on stderr
+
+parser = argparse.ArgumentParser(description="Follow the ABQ daily data record files.")
+parser.add_argument('directory', nargs='?', default='.',
+                    help="directory the application saves its CSV files in (default: current)")
+parser.add_argument('--checkpoint', help="file to keep the read position in between runs")
+parser.add_argument('--interval', type=float, default=2.0, help="seconds between checks (default: 2)")
+parser.add_argument('--once', action='store_true', help="print the new records and exit")
+args = parser.parse_args()
+
+follower = CSVFollower(args.directory, checkpoint=args.checkpoint)
+if args.once:
+  records = follower.poll()
+else:
+  records = follower.follow(args.interval)
+
+try:
+  for record in records:
+    print(json.dumps(record, default=str), flush=True)   # Dates are written as yyyy-mm-dd
+  if args.once:
+    follower.save_checkpoint()          # Only once every record is printed, like follow()
+except KeyboardInterrupt:
+  pass
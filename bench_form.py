@@ -0,0 +1,67 @@
+"""
+Benchmark DataRecordForm get/set/reset against the per-field LabelInput path.
+Needs a display, like the application itself.
+
+  python3 bench_form.py [rounds]
+"""
+
+import sys
+import timeit
+import tkinter as tk
+from datetime import datetime
+from abq_data_entry import views as v
+from abq_data_entry import models as m
+
+def per_field_get(form):
+  """The old path: one LabelInput.get per field."""
+  return {key: widget.get() for key, widget in form.inputs.items()}
+
+def per_field_set(form, data):
+  """The old path: one LabelInput.set per field."""
+  for key, widget in form.inputs.items():
+    widget.set(data.get(key, ''))
+
+def per_field_reset(form):
+  """The old path: per-field reads, clears and sets, as DataRecordForm.reset used to do."""
+  lab = form.inputs['Lab'].get()
+  time = form.inputs['Time'].get()
+  technician = form.inputs['Technician'].get()
+  plot = form.inputs['Plot'].get()
+  plot_values = form.inputs['Plot'].input.cget('values')
+  for widget in form.inputs.values():
+    widget.set('')
+  form.inputs['Date'].set(datetime.today().strftime('%Y-%m-%d'))
+  form.inputs['Time'].input.focus()
+  if plot not in ('', plot_values[-1]):
+    form.inputs['Lab'].set(lab)
+    form.inputs['Time'].set(time)
+    form.inputs['Technician'].set(technician)
+    form.inputs['Plot'].set(plot_values[plot_values.index(plot) + 1])
+    form.inputs['Seed sample'].input.focus()
+
+def main(rounds=1000):
+  root = tk.Tk()
+  root.withdraw()                         # No need to show the window to time it
+  form = v.DataRecordForm(root, m.CSVModel.fields)
+  data = form.get()
+  data.update({'Time': '08:00', 'Technician': 'J Simms', 'Lab': 'A', 'Plot': '3',
+               'Seed sample': 'AX478', 'Humidity': 24.5, 'Light': 1.03,
+               'Temperature': 22.1, 'Plants': 9, 'Blossoms': 21, 'Fruit': 3,
+               'Minimum Height': 11.2, 'Maximum Height': 32.7, 'Median Height': 18.4,
+               'Notes': 'Benchmark record'})
+  assert per_field_get(form) == form.get()
+
+  cases = [
+    ('get', lambda: per_field_get(form), form.get),
+    ('set', lambda: per_field_set(form, data), lambda: form.set(data)),
+    ('reset', lambda: per_field_reset(form), form.reset),
+  ]
+  print('{:<6}{:>14}{:>14}{:>10}'.format('op', 'per-field us', 'bulk us', 'speedup'))
+  for name, old, new in cases:
+    old_time = min(timeit.repeat(old, number=rounds, repeat=3)) / rounds * 1e6
+    new_time = min(timeit.repeat(new, number=rounds, repeat=3)) / rounds * 1e6
+    print('{:<6}{:>14.1f}{:>14.1f}{:>9.1f}x'.format(name, old_time, new_time, old_time / new_time))
+  root.destroy()
+
+if __name__ == '__main__':
+  main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)